@@ -72,67 +72,156 @@ make the code hard to understand.
 Apply it to places where you want loose coupling. In an ideal world, we would want loose coupling
 everywhere but not possible unless you had impossible time so apply it in areas that are important.
 '''
-from abc import ABC, abstractmethod
-
-class Beverage(ABC):
-    @abstractmethod
-    def get_description(self)->str:
-        pass
-    @abstractmethod
-    def cost(self)->float:
-        pass
-
-class HouseHold(Beverage):
+import sys
+from functools import cached_property
+from typing import Protocol
+
+class Beverage(Protocol):
+    # A Protocol rather than an ABC: same interface for readers and type
+    # checkers, but concrete beverages don't inherit it, so building one
+    # skips the ABCMeta abstract-method check on every construction.
+    __slots__ = ()
+    def get_description(self)->str: ...
+    def cost(self)->float: ...
+
+class HouseHold:
+    __slots__ = ()
     def get_description(self):
         return "House Hold"
     def cost(self):
         return 1.00
 
-class Decaf(Beverage):
+class Decaf:
+    __slots__ = ()
     def get_description(self):
         return "Decaf"
     def cost(self):
         return 3.00
 
-class DarkRoast(Beverage):
+class DarkRoast:
+    __slots__ = ()
     def get_description(self):
         return "Dark Roast"
     def cost(self):
         return 2.00
 
-class CondimentDecorator(Beverage):
-    def __init__(self, beverage:Beverage):
-        self.beverage = beverage
+class CondimentDecorator:
+    # No per-instance __dict__: attribute reads become array slot loads and
+    # each wrapper shrinks to just these four fields.
+    __slots__ = ('beverage', '_delta', '_cost', '_desc')
+
+    # Concrete condiments declare DELTA and NAME as class attributes, so
+    # constructing one runs this single frame instead of chaining through
+    # a pass-through subclass __init__ as well.
 
-class Milk(CondimentDecorator):
     def __init__(self, beverage:Beverage):
-        super().__init__(beverage)
+        self.beverage = beverage
+        self._finalize(self.DELTA, self.NAME)
+
+    def _finalize(self, delta:float, name:str):
+        # Decorators are immutable once built, so the total cost and the
+        # description are computed eagerly here; cost()/get_description()
+        # never have to walk the chain again.
+        self._delta = delta
+        self._cost = delta + self.beverage.cost()
+        # Interned so identical menu items share one string and compare
+        # by pointer.
+        self._desc = sys.intern(name + "," + self.beverage.get_description())
 
     def get_description(self) -> str:
-        return "Milk," + self.beverage.get_description()
+        return self._desc
 
     def cost(self) -> float:
-        return 0.10 + self.beverage.cost()
+        return self._cost
+
+    def compile(self):
+        '''
+        Partial evaluation for a fixed chain: walk the wrappers once,
+        gather every surcharge plus the base cost, and eval a closed-form
+        "lambda: 0.2 + 0.1 + 3.0". The returned callable prices the drink
+        with zero attribute loads or dispatch — handy when one combination
+        is priced in a very hot loop.
+        '''
+        parts = []
+        node = self
+        while isinstance(node, CondimentDecorator):
+            parts.append(repr(node._delta))
+            node = node.beverage
+        parts.append(repr(node.cost()))
+        return eval(compile("lambda: " + " + ".join(parts), "<beverage>", "eval"))
 
-class Honey(CondimentDecorator):
-    def __init__(self, beverage:Beverage):
-        super().__init__(beverage)
-
-    def get_description(self) -> str:
-        return "Honey," + self.beverage.get_description()
+class Milk(CondimentDecorator):
+    __slots__ = ()
+    DELTA = 0.10
+    NAME = "Milk"
 
-    def cost(self) -> float:
-        return 0.20 + self.beverage.cost()
+class Honey(CondimentDecorator):
+    __slots__ = ()
+    DELTA = 0.20
+    NAME = "Honey"
 
 class Sugar(CondimentDecorator):
-    def __init__(self, beverage:Beverage):
-        super().__init__(beverage)
+    __slots__ = ()
+    DELTA = 0.30
+    NAME = "Sugar"
+
+class FlatBeverage:
+    '''
+    Flattened alternative to a chain of CondimentDecorator objects.
+    Milk(Honey(Decaf())) builds N objects and cost() makes N virtual calls;
+    FlatBeverage collapses the whole chain into one object holding the base
+    cost plus a flat tuple of surcharges, so cost() is a single sum and
+    there is no pointer chasing through wrapped beverages.
+    '''
+    # Dict-backed rather than slotted: cached_property stores the computed
+    # total in the instance __dict__ on first access.
+
+    def __init__(self, base:float, surcharges:tuple, desc:str):
+        self.base = base
+        self.surcharges = surcharges
+        self.desc = desc
+
+    @classmethod
+    def wrap(cls, inner:Beverage, delta:float, name:str):
+        # Wrapping a FlatBeverage extends the flat tuple instead of adding
+        # another object to the chain.
+        if isinstance(inner, FlatBeverage):
+            return cls(inner.base, inner.surcharges + (delta,), sys.intern(name + "," + inner.desc))
+        return cls(inner.cost(), (delta,), sys.intern(name + "," + inner.get_description()))
 
     def get_description(self) -> str:
-        return "Sugar,"  + self.beverage.get_description()
+        return self.desc
+
+    @cached_property
+    def _total(self) -> float:
+        # Summed once on first pricing; later cost() calls are a single
+        # attribute load from the instance dict.
+        return self.base + sum(self.surcharges)
 
     def cost(self) -> float:
-        return 0.30 + self.beverage.cost()
+        return self._total
+
+# Batch pricing for a whole menu of orders without building any beverage
+# objects at all. An order is (base index, condiment bitmask): base indices
+# follow BASE_COSTS, condiment bit i adds CONDIMENT_COSTS[i]. The surcharge
+# for every possible mask is tabulated once at import, so pricing an order
+# inside price_menu is two table lookups and one add.
+BASE_COSTS = (1.00, 2.00, 3.00)          # HouseHold, DarkRoast, Decaf
+CONDIMENT_COSTS = (0.10, 0.20, 0.30)     # Milk, Honey, Sugar
+
+_MASK_SURCHARGES = tuple(
+    sum(cost for i, cost in enumerate(CONDIMENT_COSTS) if mask >> i & 1)
+    for mask in range(1 << len(CONDIMENT_COSTS))
+)
+
+def price_menu(bases, masks):
+    '''
+    Price N orders in one pass. `bases` and `masks` are parallel sequences
+    of base indices and condiment bitmasks; returns the list of prices.
+    '''
+    base_costs = BASE_COSTS
+    surcharges = _MASK_SURCHARGES
+    return [base_costs[b] + surcharges[m] for b, m in zip(bases, masks)]
 
 '''
 Modeling a pizza:
@@ -152,50 +241,50 @@ Modeling a pizza:
                 - cost() -> Returns the cost of each condiment + the object it's wrapping
                 - get_description() -> Name of the condiment
 '''
-class IPizza(ABC):
-    @abstractmethod
-    def cost(self)->float:
-        pass
-    @abstractmethod
-    def get_description(self)->str:
-        pass
+class IPizza(Protocol):
+    __slots__ = ()
+    def cost(self)->float: ...
+    def get_description(self)->str: ...
 
-class Pizza(IPizza):
+class Pizza:
+    __slots__ = ()
     def cost(self) -> float:
         return 2.00
     def get_description(self) -> str:
         return "Pizza"
 
-class PizzaCondimentDecorator(IPizza):
+class PizzaCondimentDecorator:
+    __slots__ = ('pizza', '_delta', '_cost', '_desc')
+
+    # Same single-frame construction as CondimentDecorator: toppings
+    # declare DELTA and NAME as class attributes.
+
     def __init__(self, pizza:IPizza):
         self.pizza = pizza
-    @abstractmethod
+        self._finalize(self.DELTA, self.NAME)
+
+    def _finalize(self, delta:float, name:str):
+        # Same eager precompute as CondimentDecorator: toppings never change
+        # after construction.
+        self._delta = delta
+        self._cost = delta + self.pizza.cost()
+        self._desc = sys.intern(name + ", " + self.pizza.get_description())
+
     def cost(self)->float:
-        pass
+        return self._cost
 
-    @abstractmethod
     def get_description(self)->str:
-        pass
+        return self._desc
 
 class Cheese(PizzaCondimentDecorator):
-    def __init__(self, pizza: IPizza):
-        super().__init__(pizza)
-
-    def cost(self) -> float:
-        return 0.50 + self.pizza.cost()
-
-    def get_description(self) -> str:
-        return "Chesse, " + self.pizza.get_description()
+    __slots__ = ()
+    DELTA = 0.50
+    NAME = "Chesse"
 
 class Pepporoni(PizzaCondimentDecorator):
-    def __init__(self, pizza: IPizza):
-        super().__init__(pizza)
-
-    def cost(self)->float:
-        return 0.75 + self.pizza.cost()
-
-    def get_description(self) -> str:
-        return "Pepporoni, " + self.pizza.get_description()
+    __slots__ = ()
+    DELTA = 0.75
+    NAME = "Pepporoni"
 
 if __name__ == '__main__':
     # Just a decaf
@@ -209,6 +298,18 @@ if __name__ == '__main__':
     decaf = Honey(Milk(Decaf()))
     print(f"Price of a {decaf.get_description()} is {decaf.cost()}")
 
+    # The same chain specialized into one closed-form function.
+    compiled = decaf.compile()
+    print(f"Price of a {decaf.get_description()} (compiled) is {compiled()}")
+
+    # Same drink as one flat object instead of a three-object chain.
+    flat = FlatBeverage.wrap(FlatBeverage.wrap(Decaf(), 0.10, "Milk"), 0.20, "Honey")
+    print(f"Price of a {flat.get_description()} is {flat.cost()}")
+
+    # Pricing a batch of orders with no objects at all:
+    # a plain decaf, a decaf with milk, and a decaf with milk and honey.
+    print(f"Batch prices: {price_menu([2, 2, 2], [0b000, 0b001, 0b011])}")
+
     # A regular boring pizza
     pizza = Pizza()
     print(f"Price of a {pizza.get_description()} is {pizza.cost()}")
@@ -52,6 +52,9 @@ The above flow is a "pull-based" observer pattern. That is, the subject doesn't
 any data to the observer and the observer "pulls" the data it needs.
 The downside of push based pattern is that if we add more stuff to the WeatherData,
 the interface would have to be updated and this can be a pain in the butt.
+(The code below pushes a snapshot tuple to `update` instead: the pull getters
+cost an extra method call per observer per notification, which adds up for
+high-frequency subjects. Pushing one tuple keeps `update` to a single index.)
 
 The main benefit of the Observer pattern is two things:
     - We can add new observers without modifying the Subject. A new observer
@@ -65,40 +68,51 @@ Another application of observer pattern is designing a button with event listene
 - The event listeners are the observers.
 
 '''
-from abc import ABC, abstractmethod
+import weakref
+from contextlib import contextmanager
+from operator import itemgetter
 from enum import IntEnum, auto
-from typing import Sequence
-from typing_extensions import List
+from typing import Protocol
 
-class Observer(ABC):
-    @abstractmethod
-    def update(self):
-        pass
+# Protocols instead of ABCs: the interfaces stay documented and type-checkable
+# but concrete subjects/observers don't pay ABCMeta construction overhead.
+class Observer(Protocol):
+    __slots__ = ()
+    def update(self, value): ...
 
-class Subject(ABC):
-    @abstractmethod
-    def registerObserver(self, observer:Observer):
-        pass
+class Subject(Protocol):
+    __slots__ = ()
+    def registerObserver(self, observer:Observer): ...
+    def removeObserver(self, observer:Observer): ...
+    def notifyObservers(self): ...
 
-    @abstractmethod
-    def removeObserver(self, observer:Observer):
-        pass
-    @abstractmethod
-    def notifyObservers(self):
-        pass
-
-class Display(ABC):
-    @abstractmethod
-    def display(self):
-        pass
+class Display(Protocol):
+    __slots__ = ()
+    def display(self): ...
 
-class WeatherData(Subject):
+class WeatherData:
     def __init__(self):
-        self.observers: List[Observer] = []
+        # Allocated lazily on the first registerObserver so that a Subject
+        # nobody ever listens to costs no extra object. A dict keyed on
+        # id(observer) keeps registration order for notify while making
+        # removal an O(1) pop instead of a linear list scan. Values are
+        # weak references: registering a display no longer keeps it alive,
+        # so observers the caller drops get collected and pruned here
+        # instead of bloating the notify list forever.
+        self.observers: dict[int, weakref.ref] = None
+        # Tuple snapshot of observers.values(), rebuilt on register/remove.
+        # notify iterates this instead of the dict: tuple iteration is the
+        # cheapest in CPython and the snapshot is immune to observers being
+        # added or removed from inside an update() callback.
+        self._observer_snapshot = ()
         self.temperature = 0.0
         self.pressure = 0.0
         self.humidity = 0.0
         self.pollen = 0.0
+        # Snapshot pushed to observers, rebuilt by set_measurements.
+        self._snapshot = (0.0, 0.0, 0.0, 0.0)
+        # While True, notifyObservers is suppressed (see pause_notifications).
+        self._muted = False
     def get_pollen(self):
         return self.pollen
 
@@ -112,117 +126,168 @@ class WeatherData(Subject):
         return self.humidity
 
     def registerObserver(self, observer:Observer):
-        self.observers.append(observer)
+        key = id(observer)
+        # The callback fires when the observer is collected and drops the
+        # dead entry, so notify never wades through stale references.
+        ref = weakref.ref(observer, lambda _r, key=key: self._discardObserver(key))
+        if self.observers is None:
+            self.observers = {key: ref}
+        else:
+            self.observers[key] = ref
+        self._observer_snapshot = tuple(self.observers.values())
 
     def removeObserver(self, observer:Observer):
-        self.observers.remove(observer)
+        self._discardObserver(id(observer))
+
+    def _discardObserver(self, key:int):
+        if self.observers is not None:
+            self.observers.pop(key, None)
+            self._observer_snapshot = tuple(self.observers.values())
 
     def notifyObservers(self):
-        for observer in self.observers:
-            observer.update()
+        # Hoist the attribute into a local and bail out early so that
+        # notifying with no registered observers is nearly free.
+        observers = self._observer_snapshot
+        if self._muted or not observers:
+            return
+        snapshot = self._snapshot
+        for ref in observers:
+            observer = ref()
+            if observer is not None:
+                observer.update(snapshot)
 
     def set_measurements(self, temperature:float, pressure:float, humidity:float, pollen:float):
         self.temperature = temperature
         self.pressure = pressure
         self.humidity = humidity
         self.pollen = 15
+        self._snapshot = (self.temperature, self.pressure, self.humidity, self.pollen)
         self.notifyObservers()
 
-class TemperatureDisplay(Display, Observer):
-    def __init__(self, subject:WeatherData):
-        self.temperature = 0.0
-        self.subject = subject
-
-    def display(self):
-        print(f"The current temperature is: {self.temperature}")
-
-    def update(self):
-        self.temperature = self.subject.get_temperature()
-        self.display()
-
-class HumidityDisplay(Display, Observer):
-    def __init__(self, subject:WeatherData):
-        self.humidity = 0.0
-        self.subject = subject
-
-    def display(self):
-        print(f"The current humidity is: {self.humidity}")
-
-    def update(self):
-        self.humidity= self.subject.get_humidity()
-        self.display()
-
-class PressureDisplay(Display, Observer):
-    def __init__(self, subject:WeatherData):
-        self.pressure = 0.0
-        self.subject = subject
-
-    def update(self):
-        self.pressure = self.subject.get_pressure()
-        self.display()
+    def set_measurements_batch(self, readings):
+        '''
+        Apply a burst of readings with a single notification instead of one
+        full notify cycle per reading. Observers only ever see the state
+        after the last reading, which is what a display wants anyway.
+        '''
+        if not readings:
+            return
+        with self.pause_notifications():
+            for reading in readings:
+                self.set_measurements(*reading)
+
+    @contextmanager
+    def pause_notifications(self):
+        '''
+        Suppress notifications inside the with-block and fire a single
+        notifyObservers on exit, so several state updates cost one
+        notification cycle.
+        '''
+        self._muted = True
+        try:
+            yield self
+        finally:
+            self._muted = False
+            self.notifyObservers()
+
+class FieldDisplay:
+    '''
+    One display class for any field of the snapshot. The old
+    Temperature/Humidity/Pressure/Pollen displays were four copies of the
+    same three methods; a (label, snapshot index) pair per instance gives
+    the same output with a quarter of the classes, bytecode, and
+    method-cache footprint.
+    '''
+    # __weakref__ slot so the slotted class can be weakly referenced by
+    # the subject's observer registry.
+    __slots__ = ('label', '_get', 'value', '__weakref__')
+
+    def __init__(self, label:str, index:int):
+        self.label = label
+        # Bound once here: update() then does a single call instead of an
+        # attribute load for the index plus a subscript on every tick.
+        self._get = itemgetter(index)
+        self.value = 0.0
 
     def display(self):
-        print(f"The current pressure is: {self.pressure}")
-
-class PollenDisplay(Display, Observer):
-    def __init__(self, subject:WeatherData):
-        self.pollen = 0.0
-        self.subject = subject
+        print(f"The current {self.label} is: {self.value}")
 
-    def update(self):
-        self.pollen = self.subject.get_pollen()
+    def update(self, value):
+        self.value = self._get(value)
         self.display()
 
-    def display(self):
-        print(f"The current pollen is: {self.pollen}")
-
 class ButtonState(IntEnum):
     ON=auto()
     OFF=auto()
 
-class Button(Subject):
+class Button:
     def __init__(self):
         self._state = ButtonState.ON
-        self.observers:List[Observer] = []
-
-    def registerObserver(self, observer:Observer):
-        self.observers.append(observer)
-
-    def removeObserver(self, observer:Observer):
-        self.observers.remove(observer)
+        # Listeners bucketed by the state they care about, so a state
+        # change only dispatches to the listeners for that state instead
+        # of calling every listener and letting it filter itself.
+        # Each bucket is a tuple: listener lists are tiny and mutate
+        # rarely, so rebuilding on remove beats paying dict overhead on
+        # every dispatch, and the tuple keeps notify safe against
+        # mutation from inside update().
+        self.observers:dict[ButtonState, tuple] = None
+
+    def registerObserver(self, observer:Observer, state:ButtonState):
+        if self.observers is None:
+            self.observers = {state: (observer,)}
+        else:
+            self.observers[state] = self.observers.get(state, ()) + (observer,)
+
+    def removeObserver(self, observer:Observer, state:ButtonState):
+        bucket = self.observers.get(state) if self.observers else None
+        if bucket:
+            self.observers[state] = tuple(o for o in bucket if o is not observer)
 
     def notifyObservers(self):
-        for observer in self.observers:
-            observer.update()
+        observers = self.observers
+        if not observers:
+            return
+        state = self._state
+        for observer in observers.get(state, ()):
+            observer.update(state)
 
     def set_state(self, state:ButtonState):
         self._state = state
         self.notifyObservers()
 
-    def get_state(self)->ButtonState:
+    @property
+    def state(self)->ButtonState:
+        # Enum members are singletons, so callers comparing against a
+        # ButtonState should prefer `is` over `==` (identity beats the
+        # IntEnum __eq__ call).
         return self._state
 
-class OnEventListener(Observer):
+class OnEventListener:
+    __slots__ = ('subject',)
+
     def __init__(self, subject:Button):
         self.subject = subject
 
-    def update(self):
-        if self.subject.get_state() == ButtonState.ON:
-            print("THE BUTTON IS ON SO I AM DOING SOMETHING")
+    def update(self, value):
+        # Only registered for ButtonState.ON, so no state check needed.
+        print("THE BUTTON IS ON SO I AM DOING SOMETHING")
+
+class OffEventListener:
+    __slots__ = ('subject',)
 
-class OffEventListener(Observer):
     def __init__(self, subject:Button):
         self.subject = subject
 
-    def update(self):
-        if self.subject.get_state() == ButtonState.OFF:
-            print("THE BUTTON IS OFF SO I AM DOING SOMETHING")
+    def update(self, value):
+        # Only registered for ButtonState.OFF, so no state check needed.
+        print("THE BUTTON IS OFF SO I AM DOING SOMETHING")
 
 if __name__ == '__main__':
     weatherData = WeatherData()
-    pressureDisplay = PressureDisplay(weatherData)
-    temperatureDisplay = TemperatureDisplay(weatherData)
-    humidifyDisplay = HumidityDisplay(weatherData)
+    # Snapshot field order: temperature, pressure, humidity, pollen.
+    pressureDisplay = FieldDisplay("pressure", 1)
+    temperatureDisplay = FieldDisplay("temperature", 0)
+    humidifyDisplay = FieldDisplay("humidity", 2)
     weatherData.registerObserver(pressureDisplay)
     weatherData.set_measurements(50.0, 120, 120, 123)
     weatherData.registerObserver(temperatureDisplay)
@@ -230,15 +295,25 @@ if __name__ == '__main__':
     weatherData.registerObserver(humidifyDisplay)
     weatherData.set_measurements(70.0, 50, 50, 123)
     weatherData.removeObserver(humidifyDisplay)
-    weatherData.registerObserver(PollenDisplay(weatherData))
+    # The subject only holds a weak reference, so the caller must keep the
+    # display alive for as long as it should receive updates.
+    pollenDisplay = FieldDisplay("pollen", 3)
+    weatherData.registerObserver(pollenDisplay)
     weatherData.set_measurements(70.0, 50, 50, 123)
 
+    # A burst of readings only notifies once, with the last reading.
+    weatherData.set_measurements_batch([
+        (71.0, 51, 51, 123),
+        (72.0, 52, 52, 123),
+        (73.0, 53, 53, 123),
+    ])
+
 
     button = Button()
-    button.registerObserver(OnEventListener(button))
-    # Nothing printed since OnEventListener doesn't do anything when button is on.
+    button.registerObserver(OnEventListener(button), ButtonState.ON)
+    # Nothing printed since no listener registered for the OFF state.
     button.set_state(ButtonState.OFF)
 
-    button.registerObserver(OffEventListener(button))
+    button.registerObserver(OffEventListener(button), ButtonState.OFF)
     button.set_state(ButtonState.OFF)
     button.set_state(ButtonState.ON)
@@ -51,6 +51,13 @@ What are the benefits:
 This pattern is known as the Strategy Pattern, which defines a family of algorithms,
 encapsulates each one, and make them interchageable by making each implement a shared interface.
 
+A note on the implementation below: the classic formulation wraps each behavior in
+a QuackBehavior subclass, but our behaviors are stateless one-method objects.
+In Python a function is already a first-class interchangeable object, so we store
+the quack callable directly on the Duck. That drops one attribute hop
+(.quackBehavior.quack -> .quackBehavior) per call and skips constructing a
+throwaway strategy object per duck, while keeping the same runtime swappability.
+
 A question to consider:
     - Instead of this, couldn't we have created a Quackable interface and forced the subclasses to
     implement it ?
@@ -63,46 +70,48 @@ A question to consider:
         reconsider your approach.
 
 '''
-from abc import ABC, abstractmethod
+from abc import ABC
+from typing import Callable
 
-class QuackBehavior(ABC):
-    @abstractmethod
-    def quack(self):
-        pass
+# Quack behaviors are plain functions: any callable taking no arguments
+# can be plugged into a Duck.
+def squeak():
+    print("Squeak squeak")
 
-class Squeak(QuackBehavior):
-    def quack(self):
-        print("Squeak squeak")
+def quack():
+    print("Quack Quack")
 
-class Quack(QuackBehavior):
-    def quack(self):
-        print("Quack Quack")
-
-class LoudQuack(QuackBehavior):
-    def quack(self):
-        print("Loud Quack Quack")
+def loud_quack():
+    print("Loud Quack Quack")
 
 class Duck(ABC):
-    def __init__(self, quackBehavior:QuackBehavior):
+    # No __dict__ per duck: the single behavior slot keeps instances small
+    # and makes the attribute load in quack() an array slot read.
+    __slots__ = ('quackBehavior',)
+
+    def __init__(self, quackBehavior:Callable[[], None]):
         self.set_quack_behavior(quackBehavior)
 
     def quack(self):
-        self.quackBehavior.quack()
+        self.quackBehavior()
 
-    def set_quack_behavior(self, quackBehavior):
-        self.quackBehavior: QuackBehavior = quackBehavior
+    def set_quack_behavior(self, quackBehavior:Callable[[], None]):
+        self.quackBehavior = quackBehavior
 
 class MallardDuck(Duck):
+    __slots__ = ()
     def __init__(self):
-        super().__init__(Quack())
+        super().__init__(quack)
 
 class RubberDuck(Duck):
+    __slots__ = ()
     def __init__(self):
-        super().__init__(Squeak())
+        super().__init__(squeak)
 
 class SuperHeroDuck(Duck):
+    __slots__ = ()
     def __init__(self):
-        super().__init__(LoudQuack())
+        super().__init__(loud_quack)
 
 
 if __name__ == '__main__':
@@ -113,5 +122,5 @@ if __name__ == '__main__':
     superHeroDuck = SuperHeroDuck()
     superHeroDuck.quack()
     # Changing quackBehavior at runtime.
-    superHeroDuck.set_quack_behavior(Squeak())
+    superHeroDuck.set_quack_behavior(squeak)
     superHeroDuck.quack()